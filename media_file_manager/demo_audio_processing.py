@@ -10,15 +10,16 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from media.audio_processor import AudioProcessor
-from media.format_detector import FormatDetector
-from core.metadata_handler import MetadataHandler
-
 def demo_audio_processing():
     """Demonstrate the audio processing capabilities."""
+    # Imported here so just loading the script stays fast
+    from media.audio_processor import AudioProcessor
+    from media.format_detector import FormatDetector
+    from core.metadata_handler import MetadataHandler
+
     print("🎵 Media File Manager - Audio Processing Demo")
     print("=" * 50)
-    
+
     # Configuration
     config = {
         'supported_formats': {
@@ -4,31 +4,72 @@ Interactive test script for Media File Manager.
 This script allows you to test the system interactively.
 """
 
+import os
 import sys
+from collections import deque
 from pathlib import Path
 
+try:
+    import readline
+except ImportError:  # readline is not available on all platforms
+    readline = None
+
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from media.audio_processor import AudioProcessor
-from core.metadata_handler import MetadataHandler
+# Built once at module scope instead of per session
+CONFIG = {
+    'supported_formats': {
+        'audio': ['.mp3', '.flac', '.ogg', '.wav', '.aac', '.m4a'],
+        'video': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv']
+    }
+}
+
+# Recently used paths, offered back via tab completion
+_RECENT_PATHS = deque(maxlen=10)
+
+
+def _complete_recent_path(text, state):
+    """Readline completer over recently entered paths."""
+    matches = [p for p in _RECENT_PATHS if p.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _prompt_file_path():
+    """Prompt for an existing file path, or None if invalid."""
+    if readline is not None:
+        readline.set_completer(_complete_recent_path)
+        readline.parse_and_bind("tab: complete")
+
+    raw = input("Enter the path to your MP3 file: ").strip()
+    if not raw:
+        print("❌ No file path provided.")
+        return None
+
+    # Check existence on the raw string first - no point building a
+    # Path object just to reject a typo
+    if not os.path.exists(raw):
+        print(f"❌ File '{raw}' does not exist!")
+        return None
+
+    if raw in _RECENT_PATHS:
+        _RECENT_PATHS.remove(raw)
+    _RECENT_PATHS.appendleft(raw)
+    return Path(raw)
+
 
 def interactive_test():
     """Run an interactive test session."""
+    # Imported here so just loading the script stays fast
+    from media.audio_processor import AudioProcessor
+    from core.metadata_handler import MetadataHandler
+
     print("🎵 Media File Manager - Interactive Test")
     print("=" * 50)
-    
-    # Initialize components
-    config = {
-        'supported_formats': {
-            'audio': ['.mp3', '.flac', '.ogg', '.wav', '.aac', '.m4a'],
-            'video': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv']
-        }
-    }
-    
+
     try:
-        audio_processor = AudioProcessor(config)
-        metadata_handler = MetadataHandler(config)
+        audio_processor = AudioProcessor(CONFIG)
+        metadata_handler = MetadataHandler(CONFIG)
         print("✅ All components initialized successfully!")
     except Exception as e:
         print(f"❌ Error initializing components: {e}")
@@ -55,7 +96,7 @@ def interactive_test():
         elif choice == "4":
             test_metadata_update(audio_processor)
         elif choice == "5":
-            show_supported_formats(config)
+            show_supported_formats(CONFIG)
         elif choice == "6":
             print("👋 Goodbye!")
             break
@@ -67,16 +108,10 @@ def test_metadata_extraction(audio_processor):
     print("\n📋 Testing Metadata Extraction")
     print("-" * 30)
     
-    file_path = input("Enter the path to your MP3 file: ").strip()
-    if not file_path:
-        print("❌ No file path provided.")
-        return
-    
-    file_path = Path(file_path)
-    if not file_path.exists():
-        print(f"❌ File '{file_path}' does not exist!")
+    file_path = _prompt_file_path()
+    if file_path is None:
         return
-    
+
     try:
         metadata = audio_processor.extract_metadata(file_path)
         if metadata:
@@ -96,16 +131,10 @@ def test_audio_properties(audio_processor):
     print("\n🎚️  Testing Audio Properties")
     print("-" * 30)
     
-    file_path = input("Enter the path to your MP3 file: ").strip()
-    if not file_path:
-        print("❌ No file path provided.")
-        return
-    
-    file_path = Path(file_path)
-    if not file_path.exists():
-        print(f"❌ File '{file_path}' does not exist!")
+    file_path = _prompt_file_path()
+    if file_path is None:
         return
-    
+
     try:
         properties = audio_processor.get_audio_properties(file_path)
         if properties:
@@ -122,16 +151,10 @@ def test_metadata_handler(metadata_handler):
     print("\n🔧 Testing Metadata Handler")
     print("-" * 30)
     
-    file_path = input("Enter the path to your MP3 file: ").strip()
-    if not file_path:
-        print("❌ No file path provided.")
+    file_path = _prompt_file_path()
+    if file_path is None:
         return
-    
-    file_path = Path(file_path)
-    if not file_path.exists():
-        print(f"❌ File '{file_path}' does not exist!")
-        return
-    
+
     try:
         metadata = metadata_handler.extract_metadata(file_path)
         if metadata:
@@ -147,16 +170,10 @@ def test_metadata_update(audio_processor):
     print("\n✏️  Testing Metadata Update Capability")
     print("-" * 30)
     
-    file_path = input("Enter the path to your MP3 file: ").strip()
-    if not file_path:
-        print("❌ No file path provided.")
+    file_path = _prompt_file_path()
+    if file_path is None:
         return
-    
-    file_path = Path(file_path)
-    if not file_path.exists():
-        print(f"❌ File '{file_path}' does not exist!")
-        return
-    
+
     try:
         # Create test metadata
         test_metadata = {
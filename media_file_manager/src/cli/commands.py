@@ -5,14 +5,24 @@ CLI commands for Media File Manager.
 from pathlib import Path
 from typing import Dict, Any
 
-from core.file_processor import FileProcessor
-
 
 def process_files(path: Path, config: Dict[str, Any]):
     """Process media files in the specified path."""
+    # Imported here so --help and the lighter subcommands don't pay for
+    # the processing stack (mutagen, PIL, magic) at startup.
+    from core.file_processor import FileProcessor
+
     file_processor = FileProcessor(config)
     if path.is_dir():
-        file_processor.process_directory(path)
+        # Consume results as they stream in; only counters are kept.
+        succeeded = failed = 0
+        for result in file_processor.iter_process_directory(path):
+            if result.success:
+                succeeded += 1
+            else:
+                failed += 1
+        print(f"Processed {succeeded + failed} files: "
+              f"{succeeded} succeeded, {failed} failed")
     else:
         file_processor.process_file(path)
 
@@ -7,20 +7,43 @@ metadata updating.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from core.validator import FileValidator
-from core.metadata_handler import MetadataHandler
+from core.metadata_handler import MediaKind, MetadataHandler
 from core.file_renamer import FileRenamer
 from utils.backup import BackupManager
 from utils.logger import get_logger
 
 
+# Per-worker FileProcessor, built once by the pool initializer so each
+# worker reuses its handlers instead of reconstructing them per file.
+_worker_processor = None
+
+
+def _init_worker(config: Dict) -> None:
+    """Initialize a worker process with its own FileProcessor."""
+    global _worker_processor
+    _worker_processor = FileProcessor(config)
+
+
+def _process_one(file_path: Path) -> 'ProcessingResult':
+    """Process a single file in a worker process."""
+    return _worker_processor.process_file(file_path)
+
+
 @dataclass
 class ProcessingResult:
     """Result of file processing operation."""
+    # Manual __slots__ (rather than dataclass(slots=True)) keeps the
+    # declared Python 3.8 support while dropping the per-instance
+    # __dict__; thousands of these accumulate on large scans.
+    __slots__ = ('success', 'original_path', 'new_path', 'metadata', 'errors', 'warnings')
+
     success: bool
     original_path: Path
     new_path: Optional[Path]
@@ -45,6 +68,24 @@ class FileProcessor:
         self.metadata_handler = MetadataHandler(config)
         self.file_renamer = FileRenamer(config)
         self.backup_manager = BackupManager(config)
+
+        # Precompute the supported suffixes once so per-file classification
+        # is a single hash lookup instead of repeated config traversal.
+        formats = config.get('supported_formats', [])
+        if isinstance(formats, dict):
+            formats = [ext for group in formats.values() for ext in group]
+        self._media_exts = frozenset(ext.lower() for ext in formats)
+        self._media_ext_names = frozenset(ext.lstrip('.') for ext in self._media_exts)
+
+        # Resolve the remaining settings once at construction so the
+        # per-file loop never traverses the config dict.
+        processing = config.get('processing', {})
+        self.backup_enabled = config.get('backup_enabled', True)
+        self.update_metadata_enabled = config.get('update_metadata', True)
+        self.parallel_processing = processing.get('parallel_processing', False)
+        self.max_workers = processing.get('max_workers', 4)
+        self.paranoid_revalidate = processing.get('paranoid_revalidate', False)
+        self.skip_if_named = processing.get('skip_if_named', True)
         
     def process_file(self, file_path: Path) -> ProcessingResult:
         """
@@ -69,23 +110,48 @@ class FileProcessor:
         )
         
         try:
+            # Classify once; downstream helpers reuse the result instead
+            # of re-deriving it from the suffix.
+            kind = self.metadata_handler.classify(file_path)
+
+            # Fast path for already-organized libraries: if cached
+            # metadata for the unchanged file renders to the name it
+            # already has, there is nothing to back up, rename, or
+            # rewrite - skip the parse entirely.
+            if self.skip_if_named and kind is not MediaKind.OTHER:
+                cached = self.metadata_handler.cached_metadata(file_path)
+                if cached is not None:
+                    predicted = self.file_renamer.generate_filename(file_path, cached, kind)
+                    if predicted == file_path.name:
+                        self.logger.debug(f"Already organized, skipping: {file_path}")
+                        result.metadata = cached
+                        result.new_path = file_path
+                        result.success = True
+                        return result
+
+            # Parse the file header once and share it between validation
+            # and metadata extraction instead of re-opening per step.
+            parsed = self.metadata_handler.load(file_path, kind)
+
             # Step 1: Validate file
-            if not self.validator.validate_file(file_path):
+            if not self.validator.validate_file(file_path, parsed=parsed):
                 result.errors.append("File validation failed")
                 return result
-                
+
+            original_size = file_path.stat().st_size
+
             # Step 2: Create backup
-            if self.config.get('backup_enabled', True):
+            if self.backup_enabled:
                 backup_path = self.backup_manager.create_backup(file_path)
                 if not backup_path:
                     result.warnings.append("Failed to create backup")
-                    
+
             # Step 3: Extract metadata
-            metadata = self.metadata_handler.extract_metadata(file_path)
+            metadata = self.metadata_handler.extract_metadata(file_path, kind, parsed=parsed)
             result.metadata = metadata
-            
+
             # Step 4: Generate new filename
-            new_filename = self.file_renamer.generate_filename(file_path, metadata)
+            new_filename = self.file_renamer.generate_filename(file_path, metadata, kind)
             if not new_filename:
                 result.errors.append("Failed to generate new filename")
                 return result
@@ -99,13 +165,29 @@ class FileProcessor:
             result.new_path = new_path
             
             # Step 6: Update metadata
-            if self.config.get('update_metadata', True):
-                success = self.metadata_handler.update_metadata(new_path, metadata)
+            if self.update_metadata_enabled:
+                success = self.metadata_handler.update_metadata(new_path, metadata, kind)
                 if not success:
                     result.warnings.append("Failed to update metadata")
                     
-            # Step 7: Validate final result
-            if self.validator.validate_file(new_path):
+            # Step 7: Validate final result. The rename didn't touch the
+            # bytes, so a stat check is enough; a full re-parse is only
+            # done when paranoid_revalidate is configured.
+            if self.paranoid_revalidate:
+                final_ok = self.validator.validate_file(new_path)
+            else:
+                try:
+                    final_size = new_path.stat().st_size
+                except OSError:
+                    final_size = -1
+                # A tag rewrite in step 6 may legitimately change the
+                # size, so only require an exact match when none ran.
+                if self.update_metadata_enabled:
+                    final_ok = final_size > 0
+                else:
+                    final_ok = final_size == original_size
+
+            if final_ok:
                 result.success = True
                 self.logger.info(f"Successfully processed: {new_path}")
             else:
@@ -117,38 +199,158 @@ class FileProcessor:
             
         return result
         
+    def process_batch(self, file_paths: List[Path]) -> List[ProcessingResult]:
+        """
+        Process a batch of files stage by stage instead of file by file.
+
+        Runs each pipeline stage as a tight loop over the whole batch
+        (validate all, back up all, extract all, rename all, update
+        all), keeping per-file state in parallel lists. Stages touch one
+        kind of work at a time, which keeps their code and data hot and
+        lets any single stage be parallelized independently later.
+
+        Args:
+            file_paths: Files to process
+
+        Returns:
+            List of ProcessingResult objects, one per input path
+        """
+        results = [
+            ProcessingResult(
+                success=False, original_path=path, new_path=None,
+                metadata={}, errors=[], warnings=[],
+            )
+            for path in file_paths
+        ]
+        kinds = [self.metadata_handler.classify(path) for path in file_paths]
+
+        # Stage 1: validate everything; indices still in flight survive.
+        active = []
+        for i, path in enumerate(file_paths):
+            if self.validator.validate_file(path):
+                active.append(i)
+            else:
+                results[i].errors.append("File validation failed")
+
+        # Stage 2: back up all surviving files.
+        if self.backup_enabled:
+            for i in active:
+                if not self.backup_manager.create_backup(file_paths[i]):
+                    results[i].warnings.append("Failed to create backup")
+
+        # Stage 3: extract all metadata.
+        for i in active:
+            results[i].metadata = self.metadata_handler.extract_metadata(
+                file_paths[i], kinds[i])
+
+        # Stage 4: rename all files.
+        renamed = []
+        for i in active:
+            try:
+                new_name = self.file_renamer.generate_filename(
+                    file_paths[i], results[i].metadata, kinds[i])
+                if not new_name:
+                    results[i].errors.append("Failed to generate new filename")
+                    continue
+                new_path = self.file_renamer.rename_file(file_paths[i], new_name)
+            except Exception as e:
+                self.logger.error(f"Error renaming {file_paths[i]}: {e}")
+                results[i].errors.append(str(e))
+                continue
+            if not new_path:
+                results[i].errors.append("Failed to rename file")
+                continue
+            results[i].new_path = new_path
+            renamed.append(i)
+
+        # Stage 5: update all metadata.
+        if self.update_metadata_enabled:
+            for i in renamed:
+                if not self.metadata_handler.update_metadata(
+                        results[i].new_path, results[i].metadata, kinds[i]):
+                    results[i].warnings.append("Failed to update metadata")
+
+        # Stage 6: confirm the renames.
+        for i in renamed:
+            if results[i].new_path.exists():
+                results[i].success = True
+            else:
+                results[i].errors.append("Final validation failed")
+
+        return results
+
+    def iter_process_directory(self, directory_path: Path) -> Iterator[ProcessingResult]:
+        """
+        Process all media files in a directory, yielding each result.
+
+        Results are produced as files are processed, so callers that
+        only tally or report them never hold the whole library's worth
+        of ProcessingResult objects in memory at once.
+
+        Args:
+            directory_path: Path to directory containing media files
+
+        Yields:
+            ProcessingResult for each processed file
+        """
+        self.logger.info(f"Processing directory: {directory_path}")
+
+        if self.parallel_processing:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.config,),
+            ) as executor:
+                yield from executor.map(
+                    _process_one,
+                    self._iter_media_files(directory_path),
+                    chunksize=16,
+                )
+            return
+
+        for file_path in self._iter_media_files(directory_path):
+            yield self.process_file(file_path)
+
     def process_directory(self, directory_path: Path) -> List[ProcessingResult]:
         """
         Process all media files in a directory.
-        
+
+        Materializes every result; prefer iter_process_directory for
+        large libraries.
+
         Args:
             directory_path: Path to directory containing media files
-            
+
         Returns:
             List of ProcessingResult objects for each processed file
         """
-        self.logger.info(f"Processing directory: {directory_path}")
-        
-        results = []
-        media_files = self._find_media_files(directory_path)
-        
-        for file_path in media_files:
-            result = self.process_file(file_path)
-            results.append(result)
-            
-        return results
-        
-    def _find_media_files(self, directory_path: Path) -> List[Path]:
-        """Find all media files in the given directory."""
-        supported_formats = self.config.get('supported_formats', [])
-        media_files = []
-        
-        for file_path in directory_path.rglob('*'):
-            if file_path.is_file() and self._is_media_file(file_path, supported_formats):
-                media_files.append(file_path)
-                
-        return media_files
-        
-    def _is_media_file(self, file_path: Path, supported_formats: List[str]) -> bool:
+        return list(self.iter_process_directory(directory_path))
+
+    def _iter_media_files(self, directory_path: Path) -> Iterator[Path]:
+        """
+        Yield all media files under the given directory.
+
+        Uses os.scandir instead of Path.rglob so file/directory type
+        checks come from the cached readdir data rather than an extra
+        stat per entry, and Path objects are only constructed for
+        entries that pass the suffix filter.
+        """
+        stack = [str(directory_path)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            _, dot, ext = entry.name.rpartition('.')
+                            if dot and ext.lower() in self._media_ext_names:
+                                yield Path(entry.path)
+            except OSError as e:
+                self.logger.warning(f"Could not scan directory {current}: {e}")
+
+    def _is_media_file(self, file_path: Path) -> bool:
         """Check if a file is a supported media format."""
-        return file_path.suffix.lower() in supported_formats
+        return file_path.suffix.lower() in self._media_exts
@@ -5,10 +5,14 @@ This module is responsible for generating new filenames based on metadata
 and performing the renaming operation.
 """
 
-from typing import Dict, Any
+import os
+from string import Formatter
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
-from utils.file_utils import sanitize_filename, get_unique_filename
+from core.metadata_handler import MediaKind
+from utils.file_utils import sanitize_filename, standardize_case
+from utils.logger import get_logger
 
 
 class FileRenamer:
@@ -19,39 +23,106 @@ class FileRenamer:
     def __init__(self, config: Dict[str, Any]):
         """Initialize the file renamer."""
         self.config = config
+        self.logger = get_logger(__name__)
+        # Names seen per directory, so collision probing is a set
+        # lookup instead of a stat per candidate
+        self._dir_names: Dict[Path, Set[str]] = {}
+        supported = config.get("supported_formats", {})
+        if not isinstance(supported, dict):
+            supported = {}
+        self._audio_exts = frozenset(ext.lower() for ext in supported.get("audio", []))
+        self._video_exts = frozenset(ext.lower() for ext in supported.get("video", []))
+        naming = config.get("naming", {})
+        self._case_mode = naming.get("case_standardization", "")
+        self._audio_parts = self._compile_pattern(
+            naming.get("audio_pattern", "{artist} - {title}"))
+        self._video_parts = self._compile_pattern(
+            naming.get("video_pattern", "{title} ({year})"))
 
-    def generate_filename(self, file_path: Path, metadata: Dict[str, Any]) -> str:
+    @staticmethod
+    def _compile_pattern(pattern: str) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """Parse a naming pattern once into (literal, field, spec) parts."""
+        return [(literal, field, spec)
+                for literal, field, spec, _ in Formatter().parse(pattern)]
+
+    def generate_filename(self, file_path: Path, metadata: Dict[str, Any],
+                          kind: Optional[MediaKind] = None) -> str:
         """Generate a new filename based on metadata."""
-        if self._is_audio(file_path):
-            pattern = self.config.get("naming", {}).get("audio_pattern", "{artist} - {title}")
-        elif self._is_video(file_path):
-            pattern = self.config.get("naming", {}).get("video_pattern", "{title} ({year})")
+        if kind is None:
+            kind = self._classify(file_path)
+        if kind is MediaKind.AUDIO:
+            parts = self._audio_parts
+        elif kind is MediaKind.VIDEO:
+            parts = self._video_parts
         else:
             return file_path.name
 
-        try:
-            new_name = pattern.format(**metadata)
-        except KeyError as e:
-            print(f"Warning: Metadata key {e} not found for {file_path.name}")
-            return file_path.name
+        # Substitute into the precompiled parts instead of re-parsing
+        # the pattern string for every file.
+        pieces = []
+        for literal, field, spec in parts:
+            if literal:
+                pieces.append(literal)
+            if field is None:
+                continue
+            if field not in metadata:
+                self.logger.warning("Metadata key '%s' not found for %s",
+                                    field, file_path.name)
+                return file_path.name
+            pieces.append(format(metadata[field], spec or ''))
 
-        return sanitize_filename(f"{new_name}{file_path.suffix}")
+        stem = standardize_case(''.join(pieces), self._case_mode)
+        return sanitize_filename(f"{stem}{file_path.suffix}")
 
     def rename_file(self, old_path: Path, new_name: str) -> Path:
-        """Rename a file."""
-        new_path = old_path.parent / new_name
-        new_path = get_unique_filename(new_path)
-        old_path.rename(new_path)
+        """Rename a file, resolving name collisions without re-statting."""
+        parent = old_path.parent
+        new_path = parent / new_name
+        if new_path == old_path:
+            # Already named correctly - don't touch the disk (and don't
+            # let the uniqueness probe see the file as a collision).
+            return old_path
+
+        names = self._dir_names.get(parent)
+        if names is None:
+            try:
+                names = {entry.name for entry in os.scandir(parent)}
+            except OSError:
+                names = set()
+            self._dir_names[parent] = names
+
+        stem = new_path.stem
+        suffix = new_path.suffix
+        counter = 1
+        if new_name in names:
+            while f"{stem}_{counter}{suffix}" in names:
+                counter += 1
+            new_name = f"{stem}_{counter}{suffix}"
+            new_path = parent / new_name
+
+        # The cached set can predate renames made by another renamer in
+        # the same directory, and os.rename on POSIX replaces an
+        # existing target silently. One lexists syscall re-validates
+        # the chosen name right before the rename; on a hit the stale
+        # name joins the set and the counter probe continues. The set
+        # still answers the common no-collision case without a stat.
+        while os.path.lexists(new_path):
+            names.add(new_name)
+            while f"{stem}_{counter}{suffix}" in names:
+                counter += 1
+            new_name = f"{stem}_{counter}{suffix}"
+            new_path = parent / new_name
+
+        os.rename(old_path, new_path)
+        names.discard(old_path.name)
+        names.add(new_name)
         return new_path
 
-    def _is_audio(self, file_path: Path) -> bool:
-        """Check if a file is an audio file."""
-        return file_path.suffix.lower() in self.config.get("supported_formats", {}).get(
-            "audio", []
-        )
-
-    def _is_video(self, file_path: Path) -> bool:
-        """Check if a file is a video file."""
-        return file_path.suffix.lower() in self.config.get("supported_formats", {}).get(
-            "video", []
-        )
+    def _classify(self, file_path: Path) -> MediaKind:
+        """Classify a file as audio, video, or other by its suffix."""
+        suffix = file_path.suffix.lower()
+        if suffix in self._audio_exts:
+            return MediaKind.AUDIO
+        elif suffix in self._video_exts:
+            return MediaKind.VIDEO
+        return MediaKind.OTHER
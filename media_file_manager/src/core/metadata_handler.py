@@ -5,11 +5,22 @@ This module is responsible for extracting, processing, and updating
 metadata in media files.
 """
 
-from typing import Dict, Any
+from enum import Enum
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
-from media.audio_processor import AudioProcessor
-from media.video_processor import VideoProcessor
+from utils.metadata_cache import MetadataCache
+
+if TYPE_CHECKING:
+    from media.audio_processor import AudioProcessor
+    from media.video_processor import VideoProcessor
+
+
+class MediaKind(Enum):
+    """Classification of a media file by its suffix."""
+    AUDIO = "audio"
+    VIDEO = "video"
+    OTHER = "other"
 
 
 class MetadataHandler:
@@ -17,36 +28,113 @@ class MetadataHandler:
     Handles metadata extraction and updates for media files.
     """
 
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize the metadata handler."""
+    def __init__(self, config: Dict[str, Any],
+                 audio_processor: Optional['AudioProcessor'] = None,
+                 video_processor: Optional['VideoProcessor'] = None):
+        """
+        Initialize the metadata handler.
+
+        Pre-constructed processors can be injected so callers holding
+        several handlers share one instance (and its caches) instead of
+        each handler building its own. When not injected, processors
+        (and their heavy imports) are created lazily on first use.
+        """
         self.config = config
-        self.audio_processor = AudioProcessor(config)
-        self.video_processor = VideoProcessor(config)
+        self._audio_processor = audio_processor
+        self._video_processor = video_processor
+        supported = config.get("supported_formats", {})
+        if not isinstance(supported, dict):
+            supported = {}
+        self._audio_exts = frozenset(ext.lower() for ext in supported.get("audio", []))
+        self._video_exts = frozenset(ext.lower() for ext in supported.get("video", []))
+        self._cache = None
+        if config.get("processing", {}).get("metadata_cache_enabled", True):
+            self._cache = MetadataCache()
+
+    @property
+    def audio_processor(self) -> 'AudioProcessor':
+        """Audio processor, imported and constructed on first use."""
+        if self._audio_processor is None:
+            from media.audio_processor import AudioProcessor
+            self._audio_processor = AudioProcessor(self.config)
+        return self._audio_processor
+
+    @property
+    def video_processor(self) -> 'VideoProcessor':
+        """Video processor, imported and constructed on first use."""
+        if self._video_processor is None:
+            from media.video_processor import VideoProcessor
+            self._video_processor = VideoProcessor(self.config)
+        return self._video_processor
+
+    def classify(self, file_path: Path) -> MediaKind:
+        """Classify a file as audio, video, or other by its suffix."""
+        suffix = file_path.suffix.lower()
+        if suffix in self._audio_exts:
+            return MediaKind.AUDIO
+        elif suffix in self._video_exts:
+            return MediaKind.VIDEO
+        return MediaKind.OTHER
+
+    def load(self, file_path: Path, kind: Optional[MediaKind] = None):
+        """
+        Parse a media file once so validation and extraction share it.
 
-    def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
+        Returns the parsed object for audio files, or None for formats
+        that have no shared parse.
+        """
+        if kind is None:
+            kind = self.classify(file_path)
+        if kind is MediaKind.AUDIO:
+            return self.audio_processor.load(file_path)
+        return None
+
+    def cached_metadata(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Return cached metadata for an unchanged file, or None."""
+        if self._cache is None:
+            return None
+        key = MetadataCache.stat_key(file_path)
+        if key is None:
+            return None
+        return self._cache.get(key)
+
+    def extract_metadata(self, file_path: Path, kind: Optional[MediaKind] = None,
+                         parsed=None, include_artwork: bool = False) -> Dict[str, Any]:
         """Extract metadata from a media file."""
-        if self._is_audio(file_path):
-            return self.audio_processor.extract_metadata(file_path)
-        elif self._is_video(file_path):
-            return self.video_processor.extract_metadata(file_path)
-        return {}
+        if kind is None:
+            kind = self.classify(file_path)
+        if kind is MediaKind.OTHER:
+            return {}
+
+        # Unchanged files (same path, mtime, and size) are served from
+        # the cache without re-parsing their tags. Cached entries never
+        # include artwork, so artwork requests bypass the cache.
+        use_cache = self._cache is not None and not include_artwork
+        key = MetadataCache.stat_key(file_path) if use_cache else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if kind is MediaKind.AUDIO:
+            metadata = self.audio_processor.extract_metadata(
+                file_path, audio=parsed, include_artwork=include_artwork)
+        else:
+            metadata = self.video_processor.extract_metadata(file_path)
 
-    def update_metadata(self, file_path: Path, metadata: Dict[str, Any]) -> bool:
+        # Only cache successful extractions so failures are retried.
+        if key is not None and metadata:
+            self._cache.put(key, metadata)
+
+        return metadata
+
+    def update_metadata(self, file_path: Path, metadata: Dict[str, Any],
+                        kind: Optional[MediaKind] = None, force: bool = False) -> bool:
         """Update metadata in a media file."""
-        if self._is_audio(file_path):
-            return self.audio_processor.update_metadata(file_path, metadata)
-        elif self._is_video(file_path):
+        if kind is None:
+            kind = self.classify(file_path)
+        if kind is MediaKind.AUDIO:
+            return self.audio_processor.update_metadata(file_path, metadata, force=force)
+        elif kind is MediaKind.VIDEO:
             return self.video_processor.update_metadata(file_path, metadata)
         return False
-
-    def _is_audio(self, file_path: Path) -> bool:
-        """Check if a file is an audio file."""
-        return file_path.suffix.lower() in self.config.get("supported_formats", {}).get(
-            "audio", []
-        )
-
-    def _is_video(self, file_path: Path) -> bool:
-        """Check if a file is a video file."""
-        return file_path.suffix.lower() in self.config.get("supported_formats", {}).get(
-            "video", []
-        )
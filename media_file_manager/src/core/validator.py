@@ -4,10 +4,11 @@ File validation module for Media File Manager.
 This module is responsible for validating media files.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 from media.format_detector import FormatDetector
+from utils.logger import get_logger
 
 
 class FileValidator:
@@ -15,14 +16,18 @@ class FileValidator:
     Handles file validation operations.
     """
 
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize the file validator."""
+    def __init__(self, config: Dict[str, Any],
+                 format_detector: Optional[FormatDetector] = None):
+        """Initialize the file validator, optionally reusing a detector."""
         self.config = config
-        self.format_detector = FormatDetector(config)
+        self.format_detector = format_detector or FormatDetector(config)
+        self.logger = get_logger(__name__)
 
-    def validate_file(self, file_path: Path) -> bool:
-        """Validate a media file."""
-        is_valid, errors = self.format_detector.validate_file(file_path)
+    def validate_file(self, file_path: Path, parsed=None) -> bool:
+        """Validate a media file, reusing an existing parse if given."""
+        is_valid, errors = self.format_detector.validate_file(file_path, parsed)
         if not is_valid:
-            print(f"Warning: {file_path.name} is not a valid media file. Errors: {errors}")
+            # %-style args defer formatting until the record is emitted
+            self.logger.warning("%s is not a valid media file. Errors: %s",
+                                file_path.name, errors)
         return is_valid
@@ -12,7 +12,6 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from typing import Optional
 
-from cli.interface import CLIInterface
 from utils.config import ConfigManager
 from utils.logger import setup_logging
 
@@ -20,6 +19,9 @@ from utils.logger import setup_logging
 def main() -> int:
     """Main entry point for the application."""
     try:
+        # Deferred so startup only pays for the CLI machinery it uses
+        from cli.interface import CLIInterface
+
         # Setup logging
         setup_logging()
         logger = logging.getLogger(__name__)
@@ -5,8 +5,60 @@ This module handles video-specific operations including metadata
 extraction, modification, and file processing.
 """
 
+import logging
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import ffmpeg
+except ImportError:  # ffmpeg-python is optional
+    ffmpeg = None
+
+logger = logging.getLogger(__name__)
+
+# ffprobe results keyed by (path, mtime_ns, size). Each probe is a
+# fork+exec, and validation and extraction commonly hit the same file
+# back to back - sharing the result means the subprocess runs once.
+_PROBE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_PROBE_CACHE_MAX = 1024
+
+
+def probe_file(file_path: Path) -> Dict[str, Any]:
+    """
+    Run ffprobe for a file, reusing a cached result when unchanged.
+
+    Args:
+        file_path: Path to the video file
+
+    Returns:
+        The ffprobe result dictionary
+
+    Raises:
+        ImportError when ffmpeg-python is not installed, otherwise
+        whatever ffmpeg.probe raises when the probe itself fails
+    """
+    if ffmpeg is None:
+        raise ImportError("ffmpeg-python is required to probe video files")
+
+    try:
+        st = os.stat(file_path)
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    if key is not None:
+        cached = _PROBE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    probe = ffmpeg.probe(str(file_path))
+
+    if key is not None and probe:
+        if len(_PROBE_CACHE) >= _PROBE_CACHE_MAX:
+            _PROBE_CACHE.clear()
+        _PROBE_CACHE[key] = probe
+    return probe
 
 
 class VideoProcessor:
@@ -18,9 +70,55 @@ class VideoProcessor:
         """Initialize the video processor."""
         self.config = config
 
-    def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Extract metadata from a video file."""
-        return {}
+    def extract_metadata(self, file_path: Path,
+                         probe: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from a video file.
+
+        Args:
+            file_path: Path to the video file
+            probe: Optional ffprobe result reused from validation, so
+                the subprocess is not spawned a second time
+
+        Returns:
+            Dictionary containing extracted metadata
+        """
+        try:
+            if probe is None:
+                probe = probe_file(file_path)
+            if not probe:
+                return {}
+
+            metadata: Dict[str, Any] = {}
+
+            fmt = probe.get('format', {})
+            tags = fmt.get('tags', {})
+            for field in ('title', 'artist', 'date', 'genre', 'comment'):
+                value = tags.get(field) or tags.get(field.upper())
+                if value:
+                    metadata[field] = str(value)
+
+            if 'duration' in fmt:
+                metadata['duration'] = float(fmt['duration'])
+            if 'bit_rate' in fmt:
+                metadata['bitrate'] = int(fmt['bit_rate'])
+
+            video_stream = next(
+                (s for s in probe.get('streams', [])
+                 if s.get('codec_type') == 'video'), None)
+            if video_stream is not None:
+                if 'width' in video_stream:
+                    metadata['width'] = video_stream['width']
+                    metadata['height'] = video_stream['height']
+                if 'codec_name' in video_stream:
+                    metadata['codec'] = video_stream['codec_name']
+
+            return metadata
+
+        except Exception as e:
+            logger.debug("Error extracting video metadata from %s: %s",
+                         file_path, e)
+            return {}
 
     def update_metadata(self, file_path: Path, metadata: Dict[str, Any]) -> bool:
         """Update metadata in a video file."""
@@ -5,15 +5,31 @@ This module handles creating, managing, and restoring backups
 of media files before processing.
 """
 
+import atexit
+import os
 import shutil
 import json
-from datetime import datetime
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from utils.file_utils import (calculate_file_hash, copy_file_fast,
+                              hash_file_with_chunks, iter_file_chunk_hashes)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (install the 'fast' extra)
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many metadata entries the numpy round-trip costs more
+# than the Python compares it replaces.
+_NUMPY_BULK_THRESHOLD = 10000
+
 
 class BackupManager:
     """
@@ -38,9 +54,25 @@ class BackupManager:
         if self.backup_enabled:
             self.backup_dir.mkdir(parents=True, exist_ok=True)
             
-        # Backup metadata file
+        # Backup metadata store: SQLite keeps per-entry writes O(1)
+        # where the old JSON file was rewritten in full on every add.
+        # The legacy JSON file is migrated into the DB when present.
         self.metadata_file = self.backup_dir / "backup_metadata.json"
+        self.db_path = self.backup_dir / "backups.sqlite"
+        self._conn = self._open_db()
         self.backup_metadata = self._load_backup_metadata()
+
+        # Index by backup path for O(1) restore lookups, plus write
+        # batching: adds queue in _pending and deletions flip _dirty,
+        # so a bulk run pays one flush instead of a write per entry.
+        self._backup_index = {entry['backup_path']: entry['original_path']
+                              for entry in self.backup_metadata}
+        # Latest entry per original, for the unchanged-source skip
+        self._by_original = {entry['original_path']: entry
+                             for entry in self.backup_metadata}
+        self._pending: List[Dict] = []
+        self._dirty = False
+        atexit.register(self.flush)
         
     def create_backup(self, file_path: Path) -> Optional[Path]:
         """
@@ -57,13 +89,34 @@ class BackupManager:
             return None
             
         try:
+            existing = self._by_original.get(str(file_path))
+            if existing is not None and os.path.exists(existing['backup_path']):
+                # Completely unchanged source: size + mtime_ns match
+                # makes a re-run O(stat) instead of O(filesize)
+                st = file_path.stat()
+                if (existing.get('file_size') == st.st_size
+                        and existing.get('mtime_ns') == st.st_mtime_ns):
+                    logger.debug(f"{file_path} unchanged since last backup, "
+                                 f"reusing {existing['backup_path']}")
+                    return Path(existing['backup_path'])
+
+                # Tag-only edits leave the media body untouched; if
+                # every chunk past the leading (tag-area) one still
+                # matches, the copy would be a duplicate.
+                if (existing.get('chunk_hashes')
+                        and self._body_unchanged(file_path,
+                                                 existing['chunk_hashes'])):
+                    logger.debug(f"Media body unchanged since last backup of "
+                                 f"{file_path}, reusing {existing['backup_path']}")
+                    return Path(existing['backup_path'])
+
             # Generate backup filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = f"{time.time_ns():016x}"
             backup_filename = f"{file_path.stem}_{timestamp}{file_path.suffix}"
             backup_path = self.backup_dir / backup_filename
             
-            # Create backup
-            shutil.copy2(file_path, backup_path)
+            # Create backup via zero-copy kernel paths where available
+            copy_file_fast(file_path, backup_path)
             
             # Update metadata
             self._add_backup_entry(file_path, backup_path)
@@ -75,6 +128,82 @@ class BackupManager:
             logger.error(f"Failed to create backup for {file_path}: {e}")
             return None
             
+    def create_backups_bulk(self, paths: List[Path],
+                            max_workers: Optional[int] = None) -> Dict[Path, Optional[Path]]:
+        """
+        Back up many files, overlapping copies and batching metadata.
+
+        Per-file create_backup serializes on copy latency and rewrites
+        the metadata file after every entry. Here the copies run on a
+        thread pool - copy_file_fast sits in reflink/copy_file_range/
+        sendfile syscalls that release the GIL - and the metadata file
+        is written once for the whole batch instead of once per file.
+
+        Args:
+            paths: Files to back up
+            max_workers: Thread count override
+
+        Returns:
+            Dict mapping each path to its backup path, or None where
+            the backup failed
+        """
+        paths = list(paths)
+        if not self.backup_enabled:
+            logger.debug("Backup disabled, skipping bulk backup")
+            return {path: None for path in paths}
+        if not paths:
+            return {}
+
+        timestamp = f"{time.time_ns():016x}"
+        used_names = set()
+        targets = []
+        for file_path in paths:
+            name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+            counter = 1
+            while name in used_names:
+                name = f"{file_path.stem}_{timestamp}_{counter}{file_path.suffix}"
+                counter += 1
+            used_names.add(name)
+            targets.append(self.backup_dir / name)
+
+        def _copy_one(pair: Tuple[Path, Path]) -> Optional[Path]:
+            file_path, backup_path = pair
+            try:
+                copy_file_fast(file_path, backup_path)
+                return backup_path
+            except OSError as e:
+                logger.error(f"Failed to create backup for {file_path}: {e}")
+                return None
+
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            copied = list(executor.map(_copy_one, zip(paths, targets)))
+
+        results: Dict[Path, Optional[Path]] = {}
+        for file_path, backup_path in zip(paths, copied):
+            results[file_path] = backup_path
+            if backup_path is not None:
+                file_hash, chunk_hashes = hash_file_with_chunks(file_path)
+                st = file_path.stat()
+                entry = {
+                    'original_path': str(file_path),
+                    'backup_path': str(backup_path),
+                    'created_at': int(time.time()),
+                    'file_size': st.st_size,
+                    'file_hash': file_hash,
+                    'mtime_ns': st.st_mtime_ns,
+                    'chunk_hashes': chunk_hashes,
+                }
+                self.backup_metadata.append(entry)
+                self._backup_index[entry['backup_path']] = entry['original_path']
+                self._by_original[entry['original_path']] = entry
+                self._pending.append(entry)
+                logger.info(f"Created backup: {backup_path}")
+
+        # One metadata write for the whole batch
+        self.flush()
+        return results
+
     def restore_backup(self, backup_path: Path, restore_path: Optional[Path] = None) -> bool:
         """
         Restore a file from backup.
@@ -141,73 +270,274 @@ class BackupManager:
             return 0
             
         removed_count = 0
-        cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-        
-        for entry in self.backup_metadata[:]:
-            backup_path = Path(entry['backup_path'])
-            if backup_path.exists():
-                if backup_path.stat().st_mtime < cutoff_time:
-                    try:
-                        backup_path.unlink()
-                        self.backup_metadata.remove(entry)
-                        removed_count += 1
-                        logger.info(f"Removed old backup: {backup_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove old backup {backup_path}: {e}")
-                        
-        # Save updated metadata
-        self._save_backup_metadata()
-        
+        cutoff_time = time.time() - (max_age_days * 24 * 3600)
+
+        # One scandir pass collects every backup's mtime from the
+        # cached DirEntry stat - a single syscall per file instead of
+        # an exists() + stat() pair per metadata entry.
+        mtimes = {}
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for dir_entry in entries:
+                    if dir_entry.is_file(follow_symlinks=False):
+                        mtimes[dir_entry.path] = dir_entry.stat().st_mtime
+        except OSError as e:
+            logger.error(f"Failed to scan backup directory: {e}")
+            return 0
+
+        # For very large metadata lists, classify every entry with two
+        # vectorized compares instead of per-entry Python float math;
+        # -1 encodes "backup file missing" so one array covers both.
+        if np is not None and len(self.backup_metadata) >= _NUMPY_BULK_THRESHOLD:
+            arr = np.fromiter(
+                (mtimes.get(entry['backup_path'], -1.0)
+                 for entry in self.backup_metadata),
+                dtype=np.float64, count=len(self.backup_metadata))
+            missing_mask = (arr < 0.0).tolist()
+            expired_mask = ((arr >= 0.0) & (arr < cutoff_time)).tolist()
+        else:
+            missing_mask = expired_mask = None
+
+        # Single pass: unlink expired backups, drop entries whose file
+        # is already gone, and build the surviving list as we go.
+        kept = []
+        for index, entry in enumerate(self.backup_metadata):
+            backup_path = entry['backup_path']
+            if missing_mask is not None:
+                is_missing = missing_mask[index]
+                is_expired = expired_mask[index]
+            else:
+                mtime = mtimes.get(backup_path)
+                is_missing = mtime is None
+                is_expired = not is_missing and mtime < cutoff_time
+            if is_missing:
+                # Backup file no longer exists; drop the stale entry
+                self._backup_index.pop(backup_path, None)
+                continue
+            if is_expired:
+                try:
+                    os.unlink(backup_path)
+                    self._backup_index.pop(backup_path, None)
+                    removed_count += 1
+                    logger.info(f"Removed old backup: {backup_path}")
+                    continue
+                except OSError as e:
+                    logger.error(f"Failed to remove old backup {backup_path}: {e}")
+            kept.append(entry)
+
+        if len(kept) != len(self.backup_metadata):
+            self.backup_metadata = kept
+            self._by_original = {entry['original_path']: entry
+                                 for entry in kept}
+            self._dirty = True
+            self.flush()
+
         return removed_count
+
+    def flush(self) -> None:
+        """Persist pending metadata mutations, if any."""
+        if self._dirty:
+            # Deletions happened; resync the whole store
+            self._save_backup_metadata()
+        elif self._pending and self._conn is not None:
+            # Only adds: batch-insert the new rows
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO backups " + self._INSERT_COLUMNS,
+                        [self._entry_row(entry) for entry in self._pending])
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save backup entries: {e}")
+        elif self._pending:
+            self._save_backup_metadata()
+        self._pending = []
+        self._dirty = False
         
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """Open (and create) the SQLite metadata store, best-effort."""
+        if not self.backup_enabled and not self.db_path.exists():
+            return None
+        try:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS backups ("
+                "original_path TEXT, backup_path TEXT PRIMARY KEY, "
+                "created_at TEXT, file_size INTEGER, file_hash TEXT)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_backups_original "
+                "ON backups(original_path)"
+            )
+            for column in ("chunk_hashes TEXT", "mtime_ns INTEGER"):
+                try:
+                    conn.execute(f"ALTER TABLE backups ADD COLUMN {column}")
+                except sqlite3.OperationalError:
+                    pass  # column already exists
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            # Fall back to the legacy JSON file; backups still work.
+            logger.error(f"Backup metadata store unavailable: {e}")
+            return None
+
+    _ENTRY_FIELDS = ('original_path', 'backup_path', 'created_at',
+                     'file_size', 'file_hash', 'mtime_ns', 'chunk_hashes')
+    _INSERT_COLUMNS = "(%s) VALUES (%s)" % (
+        ", ".join(_ENTRY_FIELDS), ", ".join("?" * len(_ENTRY_FIELDS)))
+
+    @classmethod
+    def _entry_row(cls, entry: Dict) -> Tuple:
+        """Flatten an entry dict into a DB row (chunk hashes as JSON)."""
+        row = [entry.get(k) for k in cls._ENTRY_FIELDS]
+        if row[-1] is not None:
+            row[-1] = json.dumps(row[-1])
+        return tuple(row)
+
     def _load_backup_metadata(self) -> List[Dict]:
-        """Load backup metadata from file."""
+        """Load backup metadata, migrating any legacy JSON file."""
+        # Migrate the old full-file JSON store into the DB once
+        if self._conn is not None and self.metadata_file.exists():
+            try:
+                with open(self.metadata_file, 'r') as f:
+                    legacy = json.load(f)
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO backups " + self._INSERT_COLUMNS,
+                    [self._entry_row(entry) for entry in legacy])
+                self._conn.commit()
+                self.metadata_file.unlink()
+                logger.info("Migrated backup metadata from JSON to SQLite")
+            except Exception as e:
+                logger.error(f"Failed to migrate backup metadata: {e}")
+
+        if self._conn is not None:
+            try:
+                rows = self._conn.execute(
+                    "SELECT original_path, backup_path, created_at, "
+                    "file_size, file_hash, mtime_ns, chunk_hashes "
+                    "FROM backups").fetchall()
+                entries = []
+                for row in rows:
+                    entry = dict(zip(self._ENTRY_FIELDS, row))
+                    if entry.get('chunk_hashes'):
+                        entry['chunk_hashes'] = json.loads(entry['chunk_hashes'])
+                    entries.append(entry)
+                return entries
+            except sqlite3.Error as e:
+                logger.error(f"Failed to load backup metadata: {e}")
+
         if self.metadata_file.exists():
             try:
                 with open(self.metadata_file, 'r') as f:
                     return json.load(f)
             except Exception as e:
                 logger.error(f"Failed to load backup metadata: {e}")
-                
+
         return []
-        
+
     def _save_backup_metadata(self) -> None:
-        """Save backup metadata to file."""
+        """Resync the on-disk store with the in-memory entry list."""
+        if self._conn is not None:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM backups")
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO backups " + self._INSERT_COLUMNS,
+                        [self._entry_row(entry) for entry in self.backup_metadata])
+                return
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save backup metadata: {e}")
+                return
+
+        # JSON fallback: write-to-temp + rename so a crash mid-dump can
+        # never leave a truncated metadata file, and one fsync covers
+        # however many entries the dirty-flag batching accumulated.
         try:
-            with open(self.metadata_file, 'w') as f:
+            tmp_path = self.metadata_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
                 json.dump(self.backup_metadata, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.metadata_file)
         except Exception as e:
             logger.error(f"Failed to save backup metadata: {e}")
-            
+
     def _add_backup_entry(self, original_path: Path, backup_path: Path) -> None:
         """Add a new backup entry to metadata."""
+        # One read produces both the whole-file digest and the chunk
+        # digests used for tag-only change detection
+        file_hash, chunk_hashes = hash_file_with_chunks(original_path)
+        st = original_path.stat()
         entry = {
             'original_path': str(original_path),
             'backup_path': str(backup_path),
-            'created_at': datetime.now().isoformat(),
-            'file_size': original_path.stat().st_size,
-            'file_hash': self._calculate_file_hash(original_path)
+            'created_at': int(time.time()),
+            'file_size': st.st_size,
+            'file_hash': file_hash,
+            'mtime_ns': st.st_mtime_ns,
+            'chunk_hashes': chunk_hashes,
         }
-        
+
         self.backup_metadata.append(entry)
-        self._save_backup_metadata()
-        
+        self._backup_index[entry['backup_path']] = entry['original_path']
+        self._by_original[entry['original_path']] = entry
+        self._pending.append(entry)
+        self.flush()
+
     def _get_original_path(self, backup_path: Path) -> Optional[Path]:
         """Get original file path from backup metadata."""
-        for entry in self.backup_metadata:
-            if entry.get('backup_path') == str(backup_path):
-                return Path(entry['original_path'])
-        return None
+        original = self._backup_index.get(str(backup_path))
+        return Path(original) if original else None
         
-    def _calculate_file_hash(self, file_path: Path) -> Optional[str]:
-        """Calculate MD5 hash of file content."""
+    @staticmethod
+    def _body_unchanged(file_path: Path, stored_hashes: List[str]) -> bool:
+        """
+        Check whether the media body still matches stored chunk hashes.
+
+        The leading chunk holds the tag area and is allowed to differ
+        (unless it is the only chunk); any later mismatch stops the
+        read immediately, so the verdict on a changed file costs only
+        the chunks up to the first difference.
+        """
         try:
-            import hashlib
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            logger.error(f"Failed to calculate hash for {file_path}: {e}")
-            return None
+            count = 0
+            for index, digest in enumerate(iter_file_chunk_hashes(file_path)):
+                if index >= len(stored_hashes):
+                    return False
+                if digest != stored_hashes[index]:
+                    if index > 0 or len(stored_hashes) == 1:
+                        return False
+                count += 1
+            return count == len(stored_hashes)
+        except OSError:
+            return False
+
+    def _calculate_file_hash(self, file_path: Path) -> Optional[str]:
+        """Calculate a content hash of the file (hardware-backed)."""
+        return calculate_file_hash(file_path)
+
+    @staticmethod
+    def hash_many(paths: List[Path],
+                  max_workers: Optional[int] = None) -> Dict[Path, Optional[str]]:
+        """
+        Hash many files in parallel worker processes.
+
+        Hashing is CPU-bound C code, so worker processes bypass the GIL
+        and "hash N files" scales with core count instead of running on
+        a single core. (When blake3 is installed, each worker also
+        fans one large hash out across SIMD lanes internally.)
+
+        Args:
+            paths: Files to hash
+            max_workers: Process count; defaults to the CPU count
+
+        Returns:
+            Dict mapping each path to its digest, or None on failure
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(calculate_file_hash, paths, chunksize=4)
+            return dict(zip(paths, digests))
@@ -5,12 +5,17 @@ This module handles loading, validation, and access to configuration
 settings from YAML files and environment variables.
 """
 
+import logging
 import os
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import yaml
 from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ProcessingConfig:
@@ -21,6 +26,10 @@ class ProcessingConfig:
     max_workers: int = 4
     update_metadata: bool = True
     create_backups: bool = True
+    metadata_cache_enabled: bool = True
+    io_buffer_size: int = 262144  # minimum useful size for buffered tag writes
+    paranoid_revalidate: bool = False  # full re-parse after rename instead of stat check
+    skip_if_named: bool = True  # skip files whose name already matches the pattern
 
 
 @dataclass
@@ -64,30 +73,82 @@ class ConfigManager:
         """Initialize configuration manager."""
         self.config_dir = config_dir or Path(__file__).parent.parent.parent / "config"
         self.config: Optional[AppConfig] = None
+        self.supported_formats_set: frozenset = frozenset()
         
     def load_config(self) -> AppConfig:
         """Load configuration from files and environment."""
         if self.config is not None:
             return self.config
-            
-        # Load default configuration
-        default_config = self._load_default_config()
-        
-        # Load user configuration (overrides defaults)
-        user_config = self._load_user_config()
-        
-        # Merge configurations
-        merged_config = self._merge_configs(default_config, user_config)
-        
+
+        # Load the merged YAML config, via the pickle cache when the
+        # files have not changed since the last run
+        merged_config = self._load_merged_config()
+
         # Apply environment variable overrides
         merged_config = self._apply_environment_overrides(merged_config)
         
         # Validate configuration
         self._validate_config(merged_config)
-        
+
+        # Pre-compute extension set once so per-file format checks are
+        # O(1) lookups instead of list scans
+        formats = merged_config.get('supported_formats', [])
+        if isinstance(formats, dict):
+            formats = [fmt for group in formats.values() for fmt in group]
+        self.supported_formats_set = frozenset(f.lower() for f in formats)
+
         self.config = merged_config
         return merged_config
-        
+
+    def _config_stamp(self) -> List[int]:
+        """Mtimes of the config files, -1 where a file is absent."""
+        stamp = []
+        for name in ("default_config.yaml", "user_config.yaml"):
+            try:
+                stamp.append((self.config_dir / name).stat().st_mtime_ns)
+            except OSError:
+                stamp.append(-1)
+        return stamp
+
+    def _load_merged_config(self) -> Dict[str, Any]:
+        """
+        Load and merge the YAML config files, caching the result.
+
+        PyYAML's safe_load is pure Python and dominates CLI startup, so
+        the merged result is pickled to ~/.cache/media_manager keyed by
+        the source files' mtimes - repeated invocations pay a sub-ms
+        pickle load instead of two YAML parses. The cache is strictly
+        best-effort: any failure falls back to parsing.
+        """
+        cache_path = (Path.home() / ".cache" / "media_manager"
+                      / "config.pkl")
+        stamp = self._config_stamp()
+
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('stamp') == stamp:
+                return cached['config']
+        except (OSError, pickle.UnpicklingError, EOFError,
+                AttributeError, KeyError):
+            pass
+
+        default_config = self._load_default_config()
+        user_config = self._load_user_config()
+        merged_config = self._merge_configs(default_config, user_config)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.pkl.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'stamp': stamp, 'config': merged_config}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write config cache: %s", e)
+
+        return merged_config
+
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration from YAML file."""
         default_config_path = self.config_dir / "default_config.yaml"
@@ -117,7 +178,11 @@ class ConfigManager:
                 "parallel_processing": False,
                 "max_workers": 4,
                 "update_metadata": True,
-                "create_backups": True
+                "create_backups": True,
+                "metadata_cache_enabled": True,
+                "io_buffer_size": 262144,
+                "paranoid_revalidate": False,
+                "skip_if_named": True
             },
             "naming": {
                 "audio_pattern": "{artist} - {title} ({year})",
@@ -157,19 +222,36 @@ class ConfigManager:
         """Apply environment variable overrides to configuration."""
         # Example: MEDIA_MANAGER_LOG_LEVEL=DEBUG
         env_prefix = "MEDIA_MANAGER_"
-        
-        for key, value in os.environ.items():
-            if key.startswith(env_prefix):
-                config_key = key[len(env_prefix):].lower()
-                # Convert to appropriate type if possible
-                if value.lower() in ('true', 'false'):
-                    config[config_key] = value.lower() == 'true'
-                elif value.isdigit():
-                    config[config_key] = int(value)
-                else:
-                    config[config_key] = value
-                    
+
+        # Collect matching vars in one comprehension pass; a typical
+        # environment has hundreds of entries and few or no matches.
+        # The derived keys are interned: they live as dict keys for the
+        # whole run and every config lookup probes them with interned
+        # literals, so pointer equality short-circuits the compare.
+        overrides = {sys.intern(key[len(env_prefix):].lower()): value
+                     for key, value in os.environ.items()
+                     if key.startswith(env_prefix)}
+
+        for config_key, value in overrides.items():
+            config[config_key] = self._coerce_env_value(value)
+
         return config
+
+    @staticmethod
+    def _coerce_env_value(value: str) -> Any:
+        """Convert an environment string to bool/int/float when it fits."""
+        lowered = value.lower()
+        if lowered in ('true', 'false'):
+            return lowered == 'true'
+        try:
+            # int() accepts signed values, unlike the old isdigit() check
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            return value
         
     def _validate_config(self, config: Dict) -> None:
         """Validate configuration values."""
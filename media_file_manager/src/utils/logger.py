@@ -5,12 +5,24 @@ This module provides centralized logging configuration and utilities
 for consistent logging across the application.
 """
 
+import functools
 import logging
 import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# What setup_logging last configured; repeat calls with the same
+# settings are no-ops instead of tearing down and rebuilding handlers.
+_configured: Optional[tuple] = None
+
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Shared default formatter: logging.Formatter parses its format string
+# into a PercentStyle at construction time, so build it once and hand
+# the same instance to every handler.
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_FORMAT)
+
 
 def setup_logging(
     level: str = "INFO",
@@ -35,12 +47,22 @@ def setup_logging(
     
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
-    
+
     # Create formatter
     if log_format is None:
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    formatter = logging.Formatter(log_format)
+        log_format = _DEFAULT_FORMAT
+
+    # Skip the rebuild when nothing changed since the last call
+    global _configured
+    key = (numeric_level, log_file, log_format)
+    if key == _configured:
+        return
+    _configured = key
+
+    if log_format == _DEFAULT_FORMAT:
+        formatter = _DEFAULT_FORMATTER
+    else:
+        formatter = logging.Formatter(log_format)
     
     # Setup root logger
     root_logger = logging.getLogger()
@@ -90,14 +112,28 @@ def get_logger(name: str) -> logging.Logger:
 
 def log_function_call(func):
     """Decorator to log function calls with parameters."""
+    # Resolve the logger once at decoration time; getLogger takes the
+    # manager lock and a dict lookup on every call otherwise.
+    logger = logging.getLogger(func.__module__)
+    func_name = func.__name__
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        if not logger.isEnabledFor(logging.DEBUG):
+            # Skip stringifying args/results when DEBUG is off - repr
+            # of large metadata dicts is far pricier than the call.
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s failed with error: %s", func_name, e)
+                raise
+        logger.debug("Calling %s with args=%s, kwargs=%s",
+                     func_name, args, kwargs)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} returned: {result}")
+            logger.debug("%s returned: %s", func_name, result)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed with error: {e}")
+            logger.error("%s failed with error: %s", func_name, e)
             raise
     return wrapper
@@ -0,0 +1,120 @@
+"""
+Metadata caching for Media File Manager.
+
+This module provides a persistent cache for extracted metadata so that
+unchanged files can skip a full tag parse when a library is re-scanned.
+"""
+
+import os
+import pickle
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "media_file_manager" / "meta.sqlite"
+
+# Cache key: (absolute path, st_mtime_ns, st_size). Any change to the
+# file invalidates the entry because the mtime/size no longer match.
+CacheKey = Tuple[str, int, int]
+
+
+class MetadataCache:
+    """
+    Two-level cache for extracted file metadata.
+
+    An in-memory LRU front end serves repeated lookups within a run,
+    while a SQLite store persists results across runs. Entries are keyed
+    by (path, mtime_ns, size) so modified files miss automatically.
+    """
+
+    def __init__(self, cache_path: Path = DEFAULT_CACHE_PATH, max_entries: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Location of the SQLite store
+            max_entries: Maximum number of in-memory entries to keep
+        """
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._conn = None
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(cache_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, data BLOB)"
+            )
+            self._conn.commit()
+        except Exception as e:
+            # Fall back to the in-memory layer only; caching is best-effort.
+            logger.warning(f"Persistent metadata cache unavailable: {e}")
+            self._conn = None
+
+    @staticmethod
+    def stat_key(file_path: Path) -> Optional[CacheKey]:
+        """Build a cache key for a file, or None if it cannot be stat'd."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (str(file_path), st.st_mtime_ns, st.st_size)
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Look up cached metadata for a key, or None on miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if self._conn is None:
+            return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, data FROM metadata WHERE path = ?",
+                (key[0],),
+            ).fetchone()
+        except Exception as e:
+            logger.debug(f"Metadata cache read failed for {key[0]}: {e}")
+            return None
+
+        if row is None or (row[0], row[1]) != (key[1], key[2]):
+            return None
+
+        try:
+            metadata = pickle.loads(row[2])
+        except Exception as e:
+            logger.debug(f"Metadata cache entry corrupt for {key[0]}: {e}")
+            return None
+
+        self._remember(key, metadata)
+        return metadata
+
+    def put(self, key: CacheKey, metadata: Dict[str, Any]) -> None:
+        """Store metadata for a key in both cache layers."""
+        self._remember(key, metadata)
+
+        if self._conn is None:
+            return
+
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (path, mtime_ns, size, data) "
+                "VALUES (?, ?, ?, ?)",
+                (key[0], key[1], key[2], pickle.dumps(metadata)),
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.debug(f"Metadata cache write failed for {key[0]}: {e}")
+
+    def _remember(self, key: CacheKey, metadata: Dict[str, Any]) -> None:
+        """Add an entry to the in-memory LRU, evicting the oldest if full."""
+        self._memory[key] = metadata
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -3,6 +3,30 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 from media.audio_processor import AudioProcessor
 
+class _FakeInfo:
+    """Bare stream-info stub; unset slots read as missing attributes."""
+    __slots__ = ('length', 'bitrate')
+
+
+class _FakeAudio:
+    """Minimal stand-in for a parsed mutagen file.
+
+    Attribute access on a MagicMock dispatches through __getattr__ and
+    per-child bookkeeping; a plain __slots__ class is a direct offset
+    load and exposes exactly what the processor touches, so typos on
+    unknown attributes fail loudly.
+    """
+    __slots__ = ('tags', 'info', 'save_calls')
+
+    def __init__(self):
+        self.tags = None
+        self.info = None
+        self.save_calls = 0
+
+    def save(self, fileobj=None):
+        self.save_calls += 1
+
+
 class TestAudioProcessor(unittest.TestCase):
     def setUp(self):
         self.config = {
@@ -11,11 +35,19 @@ class TestAudioProcessor(unittest.TestCase):
             }
         }
         self.processor = AudioProcessor(self.config)
+        # One shared patcher instead of a @patch decorator per method;
+        # each decorator re-resolves the attribute path and rebuilds
+        # the patch machinery on every test.
+        patcher = patch('mutagen.File')
+        self.mock_mutagen_file = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Shared stub audio object; tests assign only the fields they
+        # care about.
+        self.mock_audio = _FakeAudio()
+        self.mock_mutagen_file.return_value = self.mock_audio
 
-    @patch('mutagen.File')
-    def test_extract_metadata_mp3(self, mock_mutagen_file):
-        # Create a mock audio file object
-        mock_audio = MagicMock()
+    def test_extract_metadata_mp3(self):
+        mock_audio = self.mock_audio
         mock_audio.tags = {
             'TIT2': ['Test Title'],
             'TPE1': ['Test Artist'],
@@ -24,31 +56,32 @@ class TestAudioProcessor(unittest.TestCase):
             'TCON': ['Pop'],
             'TRCK': ['1'],
         }
+        mock_audio.info = _FakeInfo()
         mock_audio.info.length = 300
         mock_audio.info.bitrate = 320000
-        mock_mutagen_file.return_value = mock_audio
 
         # Call the method under test
         metadata = self.processor.extract_metadata(Path('test.mp3'))
 
-        # Assert the results
-        self.assertEqual(metadata['title'], 'Test Title')
-        self.assertEqual(metadata['artist'], 'Test Artist')
-        self.assertEqual(metadata['album'], 'Test Album')
-        self.assertEqual(metadata['year'], '2023')
-        self.assertEqual(metadata['genre'], 'Pop')
-        self.assertEqual(metadata['track'], '1')
-        self.assertEqual(metadata['duration'], 300)
-        self.assertEqual(metadata['bitrate'], 320000)
-
-    @patch('mutagen.File')
-    def test_update_metadata_mp3(self, mock_mutagen_file):
-        # Create a mock audio file object with proper tag handling
-        mock_audio = MagicMock()
+        # One whole-dict compare: the equality runs in C and a failure
+        # diff shows every divergent key at once, where the old
+        # per-key assertEqual chain stopped at the first miss.
+        self.assertEqual(metadata, {
+            'title': 'Test Title',
+            'artist': 'Test Artist',
+            'album': 'Test Album',
+            'year': '2023',
+            'genre': 'Pop',
+            'track': '1',
+            'duration': 300,
+            'bitrate': 320000,
+        })
+
+    def test_update_metadata_mp3(self):
+        mock_audio = self.mock_audio
         # Create a real dictionary for tags
         tags_dict = {}
         mock_audio.tags = tags_dict
-        mock_mutagen_file.return_value = mock_audio
 
         # Create metadata to update
         metadata = {
@@ -65,7 +98,9 @@ class TestAudioProcessor(unittest.TestCase):
 
         # Assert the results
         self.assertTrue(success)
-        mock_audio.save.assert_called_once()
+        # Plain counter read; no mock_calls bookkeeping to walk the way
+        # save.assert_called_once() on a MagicMock would.
+        self.assertEqual(mock_audio.save_calls, 1)
         # Check that the tags were actually assigned
         self.assertEqual(tags_dict['TIT2'], 'New Title')
         self.assertEqual(tags_dict['TPE1'], 'New Artist')
@@ -74,15 +109,12 @@ class TestAudioProcessor(unittest.TestCase):
         self.assertEqual(tags_dict['TCON'], 'Rock')
         self.assertEqual(tags_dict['TRCK'], '2')
 
-    @patch('mutagen.File')
-    def test_extract_artwork(self, mock_mutagen_file):
-        # Create a mock audio file object with artwork
-        mock_audio = MagicMock()
+    def test_extract_artwork(self):
+        mock_audio = self.mock_audio
         mock_artwork_data = b'artwork_data'
         mock_apic = MagicMock()
         mock_apic.data = mock_artwork_data
         mock_audio.tags = {'APIC:': mock_apic}
-        mock_mutagen_file.return_value = mock_audio
 
         # Mock Image.open
         with patch('PIL.Image.open') as mock_image_open:
@@ -103,4 +135,4 @@ class TestAudioProcessor(unittest.TestCase):
             self.assertEqual(artwork['mode'], 'RGB')
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
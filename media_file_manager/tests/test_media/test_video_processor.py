@@ -1,5 +1,6 @@
 
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 from media.video_processor import VideoProcessor
 
@@ -9,11 +10,41 @@ class TestVideoProcessor(unittest.TestCase):
         self.processor = VideoProcessor(self.config)
         self.test_file = Path("test.mp4")
 
-    def test_extract_metadata(self):
-        metadata = self.processor.extract_metadata(self.test_file)
+    def test_extract_metadata_maps_probe_fields(self):
+        probe = {
+            'format': {
+                'tags': {'title': 'Test Title', 'ARTIST': 'Test Artist'},
+                'duration': '12.5',
+                'bit_rate': '800000',
+            },
+            'streams': [
+                {'codec_type': 'audio', 'codec_name': 'aac'},
+                {'codec_type': 'video', 'codec_name': 'h264',
+                 'width': 1920, 'height': 1080},
+            ],
+        }
+        with patch('media.video_processor.probe_file', return_value=probe):
+            metadata = self.processor.extract_metadata(self.test_file)
+
+        self.assertEqual(metadata, {
+            'title': 'Test Title',
+            'artist': 'Test Artist',
+            'duration': 12.5,
+            'bitrate': 800000,
+            'width': 1920,
+            'height': 1080,
+            'codec': 'h264',
+        })
+
+    def test_extract_metadata_failed_probe_returns_empty(self):
+        # A probe failure (missing file, no ffprobe binary) must come
+        # back as an empty dict, not an exception.
+        with patch('media.video_processor.probe_file',
+                   side_effect=OSError('ffprobe failed')):
+            metadata = self.processor.extract_metadata(self.test_file)
         self.assertEqual(metadata, {})
 
-    def test_update_metadata(self):
+    def test_update_metadata_not_supported(self):
         success = self.processor.update_metadata(self.test_file, {})
         self.assertFalse(success)
 